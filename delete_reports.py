@@ -5,8 +5,34 @@ Usage: python delete_reports.py
 """
 
 import os
-import glob
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Per-symbol report names written by batch runs (report_<SYMBOL>.md / news_<SYMBOL>.md)
+SYMBOL_REPORT_RE = re.compile(r"(report|news)_[A-Z0-9]+\.md")
+
+
+def remove_file(path):
+    """Remove a single file and return (removed, status message)."""
+    try:
+        os.remove(path)
+        return True, f"Deleted: {path}"
+    except FileNotFoundError:
+        return False, f"File not found: {path}"
+    except OSError as e:
+        return False, f"Error deleting {path}: {e}"
+
+
+def remove_files(paths):
+    """Remove files concurrently, printing their status messages in input order and returning how many were removed."""
+    if not paths:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        results = list(executor.map(remove_file, paths))
+    for _, message in results:
+        print(message)
+    return sum(removed for removed, _ in results)
 
 
 def delete_reports():
@@ -20,32 +46,46 @@ def delete_reports():
         "executive_summary.md"
     ]
     
-    # Delete each file if it exists
-    for file in files_to_delete:
-        if os.path.exists(file):
-            try:
-                os.remove(file)
-                print(f"Deleted: {file}")
-            except OSError as e:
-                print(f"Error deleting {file}: {e}")
-        else:
-            print(f"File not found: {file}")
+    # Delete all files in parallel, treating a missing file as already deleted
+    remove_files(files_to_delete)
+    
+    # Delete per-symbol report files written by batch runs
+    with os.scandir(".") as entries:
+        symbol_reports = [
+            entry.name for entry in entries
+            if SYMBOL_REPORT_RE.fullmatch(entry.name) and entry.is_file()
+        ]
+    remove_files(symbol_reports)
+    
+    # Delete cached vnstock data and the data files saved for the analyst agent
+    for directory, extension in ((".cache", ".parquet"), ("analysis_data", ".json")):
+        try:
+            with os.scandir(directory) as entries:
+                data_files = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(extension) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            continue
+        remove_files(data_files)
     
     # Delete ChromaDB lock files
     print("Cleaning up ChromaDB lock files...")
     try:
-        lock_files = glob.glob("chromadb-*.lock")
-        for lock_file in lock_files:
-            os.remove(lock_file)
-            print(f"Deleted: {lock_file}")
-        
+        with os.scandir(".") as entries:
+            lock_files = [
+                entry.name for entry in entries
+                if entry.name.startswith("chromadb-") and entry.name.endswith(".lock")
+            ]
+    except OSError as e:
+        print(f"Error cleaning ChromaDB lock files: {e}")
+    else:
         if not lock_files:
             print("No ChromaDB lock files found")
         else:
-            print(f"Deleted {len(lock_files)} ChromaDB lock files")
-            
-    except OSError as e:
-        print(f"Error cleaning ChromaDB lock files: {e}")
+            # Count only the lock files actually removed, not the ones that failed
+            removed = remove_files(lock_files)
+            print(f"Deleted {removed} of {len(lock_files)} ChromaDB lock files")
     
     print("Done!")
 
@@ -12,13 +12,36 @@ files_to_delete=(
     "executive_summary.md"
 )
 
-# Delete each file if it exists
+# Delete each file directly, only checking whether it exists when rm fails
 for file in "${files_to_delete[@]}"; do
-    if [ -f "$file" ]; then
-        rm "$file"
+    if error=$(rm "$file" 2>&1); then
         echo "Deleted: $file"
-    else
+    elif [ ! -e "$file" ] && [ ! -L "$file" ]; then
         echo "File not found: $file"
+    else
+        echo "Error deleting $file: $error"
+    fi
+done
+
+# Delete per-symbol report files written by batch runs (report_<SYMBOL>.md / news_<SYMBOL>.md)
+for file in report_*.md news_*.md; do
+    if [[ -f "$file" && "$file" =~ ^(report|news)_[A-Z0-9]+\.md$ ]]; then
+        if error=$(rm "$file" 2>&1); then
+            echo "Deleted: $file"
+        else
+            echo "Error deleting $file: $error"
+        fi
+    fi
+done
+
+# Delete cached vnstock data and the data files saved for the analyst agent
+for file in .cache/*.parquet analysis_data/*.json; do
+    if [ -f "$file" ]; then
+        if error=$(rm "$file" 2>&1); then
+            echo "Deleted: $file"
+        else
+            echo "Error deleting $file: $error"
+        fi
     fi
 done
 
@@ -0,0 +1,94 @@
+"""
+OpenAI Batch API support for offline-tolerant runs.
+Chat completion requests are submitted as a single JSONL batch, which is billed at a discount
+in exchange for results arriving within the batch completion window instead of immediately.
+"""
+
+import json
+import os
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+from openai import OpenAI
+
+# Batch states after which no further progress will be made
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def run_chat_batch(
+    client: OpenAI,
+    requests: List[Dict[str, Any]],
+    poll_interval: float = 30.0,
+    completion_window: str = "24h"
+) -> List[str]:
+    """
+    Run chat completion requests through the OpenAI Batch API and wait for the results.
+
+    Args:
+        client: OpenAI client used to upload the batch and fetch the results
+        requests: Chat completion request bodies (model, messages, ...), one per prompt
+        poll_interval: Seconds to wait between batch status checks
+        completion_window: Batch completion window accepted by the Batch API
+
+    Returns:
+        list: Message content of each response, in the same order as requests
+    """
+    custom_ids = [f"request-{index}" for index in range(len(requests))]
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        })
+        for custom_id, body in zip(custom_ids, requests)
+    ]
+
+    # Write the batch input file and upload it
+    batch_path = os.path.join(tempfile.gettempdir(), f"batch_{uuid.uuid4().hex}.jsonl")
+    try:
+        with open(batch_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        with open(batch_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+    finally:
+        os.remove(batch_path)
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=completion_window
+    )
+    print(f"📦 Submitted OpenAI batch {batch.id} with {len(requests)} requests")
+
+    # Poll until the batch reaches a terminal state
+    while batch.status not in TERMINAL_BATCH_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"OpenAI batch {batch.id} finished with status '{batch.status}'")
+
+    # A completed batch can still contain failed requests, which are only listed in the error file
+    if (batch.request_counts and batch.request_counts.failed) or batch.error_file_id:
+        errors = client.files.content(batch.error_file_id).text.strip() if batch.error_file_id else ""
+        raise RuntimeError(f"OpenAI batch {batch.id} has failed requests: {errors or batch.request_counts}")
+
+    # Map each response back to its request
+    contents = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            raise RuntimeError(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+        contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+    missing = [custom_id for custom_id in custom_ids if custom_id not in contents]
+    if missing:
+        raise RuntimeError(f"OpenAI batch {batch.id} returned no response for {', '.join(missing)}")
+
+    return [contents[custom_id] for custom_id in custom_ids]
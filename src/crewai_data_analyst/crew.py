@@ -3,9 +3,21 @@ CrewAI Financial Data Analyst Crew
 This module orchestrates the financial analysis crew with configuration-based setup.
 """
 
+import asyncio
+import copy
+import datetime
+import functools
+import io
+import json
 import os
+import re
+import string
+import threading
 import warnings
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Awaitable, Callable, List, Optional
 from dotenv import load_dotenv
 import yaml
 import pandas as pd
@@ -13,7 +25,10 @@ from vnstock import Vnstock, Listing
 
 from crewai import Agent, Task, Crew, Process
 from crewai.llm import LLM
-from .tools.financial_data_tools import FinancialDataTool, NewsSearchTool
+from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory
+from openai import OpenAI
+from .batch_api import run_chat_batch
+from .tools.financial_data_tools import FinancialBundle, FinancialDataTool, NewsSearchTool
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
@@ -21,32 +36,168 @@ warnings.filterwarnings("ignore")
 # Load environment variables
 load_dotenv()
 
+# Prefer the libyaml-backed C loader, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Use the Rust-backed yaml-rs parser when it is installed, otherwise PyYAML
+try:
+    from yaml_rs import loads as _yaml_loads
+except ImportError:
+    def _yaml_loads(text: str) -> Any:
+        return yaml.load(text, Loader=_YamlLoader)
+
+# Line items kept in the data handed to the analyst, matched case-insensitively as substrings
+# of column names. Frames not listed here (ratios, dividends) keep all of their columns.
+KEEP_COLS = {
+    'income_statement': [
+        'revenue', 'net sales', 'cost of sales', 'gross profit', 'operating profit',
+        'interest expense', 'profit before tax', 'net profit', 'attributable to parent'
+    ],
+    'balance_sheet': [
+        'current assets', 'total assets', 'cash', 'receivable', 'inventor',
+        'current liabilities', 'liabilities', 'borrowing', "owner's equity", 'total resources'
+    ],
+    'cash_flow': [
+        'operating activities', 'investing activities', 'financing activities',
+        'fixed assets', 'depreciation', 'dividends paid', 'net increase'
+    ],
+}
+
+# Identifier columns always kept alongside the selected line items
+META_COLS = ('ticker', 'yearReport', 'lengthReport')
+
+# Fiscal years of history handed to the analyst, and the columns holding the year
+MAX_YEARS = 5
+YEAR_COLS = ('yearReport', 'cash_year')
+
+# Use orjson for JSON embedded in prompts when it is installed, otherwise the standard library
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str)
+
+# Embedding model and storage directory used when crew memory is enabled, so that the memory
+# store persists and accumulates across runs instead of being rebuilt each time
+MEMORY_EMBEDDING_MODEL = "text-embedding-3-small"
+MEMORY_STORAGE_DIR = ".crew_memory"
+
+# crewai-tools runs code in a Docker container with a fixed name and removes any existing
+# container of that name on start, so only one analysis crew may use it at a time
+_CODE_INTERPRETER_LOCK = threading.Lock()
+
+# Frames described in the analyst's data context: (FinancialBundle field, comment, variable name)
+DATA_CONTEXT_FRAMES = (
+    ('income_statement', 'Income Statement DataFrame (use this exact data)', 'income_statement_data'),
+    ('balance_sheet', 'Balance Sheet DataFrame (use this to query key financial metrics)', 'balance_sheet_data'),
+    ('financial_ratios', 'Financial Ratios DataFrame (use this exact data)', 'financial_ratios_data'),
+    ('cash_flow', 'Cash Flow DataFrame (use this exact data)', 'cash_flow_data'),
+    ('dividend_schedule', 'Dividend Schedule DataFrame (use this exact data)', 'dividend_data'),
+)
+
+
+@dataclass
+class AnalysisResult:
+    """
+    Combined output of the analysis and news crews, mirroring CrewOutput.tasks_output.
+    """
+    tasks_output: List[Any] = field(default_factory=list)
+    
+    def __str__(self) -> str:
+        return "\n\n".join(str(output) for output in self.tasks_output)
+
+
+def _to_template(description: str) -> string.Template:
+    """Convert a str.format-style description ({name} placeholders) into a string.Template."""
+    return string.Template(re.sub(r"\{(\w+)\}", r"${\1}", description.replace("$", "$$")))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file, cached by path and modification time."""
+    return _yaml_loads(Path(path).read_text(encoding="utf-8"))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_listing_df(day: str) -> pd.DataFrame:
+    """Return the industry listing of all symbols indexed by upper-case symbol, cached for the given day."""
+    stock_list = Listing().symbols_by_industries()
+    stock_list = stock_list.set_index(stock_list['symbol'].str.upper())
+    # Keep one row per symbol so that .loc always returns a single row
+    return stock_list[~stock_list.index.duplicated()]
+
+
+@functools.cache
+def _get_llm(model: str, api_key: str) -> LLM:
+    """Return the shared LLM client for a model and API key, created on first use."""
+    return LLM(model=model, api_key=api_key)
+
+
+def _run_sync(coroutine_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    asyncio.run cannot be nested inside a running event loop (e.g. Jupyter), so in that case the
+    coroutine is created and run on a worker thread with its own loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_factory())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(coroutine_factory())).result()
+
+
+def _frame_manifest(path: Optional[str], df: pd.DataFrame) -> str:
+    """Describe a saved DataFrame as compact JSON with its file path and column names (none if it was empty)."""
+    return _json_dumps({"path": path, "columns": df.columns.tolist() if path else []})
+
 
 class FinancialAnalysisCrew:
     """
     CrewAI-based financial analysis crew with configuration-driven setup.
     """
     
-    def __init__(self, openai_api_key: str = None):
+    def __init__(self, openai_api_key: str = None, use_batch_api: bool = False, use_memory: bool = False):
         """
         Initialize the Financial Analysis Crew.
         
         Args:
             openai_api_key: OpenAI API key for the LLM
+            use_batch_api: Submit the task prompts through the OpenAI Batch API (lower cost,
+                results within 24h) instead of running the agents live. Agents cannot use
+                tools in this mode.
+            use_memory: Enable CrewAI memory backed by a persistent store. Off by default, since
+                each run otherwise pays for embedding task outputs into a store it never reuses.
         """
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if not self.openai_api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
+        self.use_batch_api = use_batch_api
+        self.use_memory = use_memory
+        self.memory_embedder = {
+            "provider": "openai",
+            "config": {"model": MEMORY_EMBEDDING_MODEL, "api_key": self.openai_api_key}
+        }
         
         # Load configurations
         self.agents_config = self._load_config("config/agents.yaml")
         self.tasks_config = self._load_config("config/tasks.yaml")
         
+        # Task description templates, converted once rather than re-parsed on every task
+        self._task_templates = {
+            task_name: _to_template(task_config['description'])
+            for task_name, task_config in self.tasks_config.items()
+        }
+        
         # Initialize LLM
-        self.llm = LLM(
-            model="gpt-4.1-mini",
-            api_key=self.openai_api_key
-        )
+        self.llm = _get_llm("gpt-4.1-mini", self.openai_api_key)
         
         # Initialize tools
         self.financial_tool = FinancialDataTool()
@@ -58,8 +209,8 @@ class FinancialAnalysisCrew:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load YAML configuration file."""
         config_file = os.path.join(os.path.dirname(__file__), config_path)
-        with open(config_file, 'r') as file:
-            return yaml.safe_load(file)
+        # Copy so callers can mutate their config without affecting the cached parse
+        return copy.deepcopy(_load_yaml_cached(config_file, os.path.getmtime(config_file)))
     
     def _create_agents(self) -> Dict[str, Agent]:
         """Create agents from configuration."""
@@ -91,49 +242,38 @@ class FinancialAnalysisCrew:
         
         return agents
     
-    def _create_task(self, task_name: str, agent_name: str, **context) -> Task:
-        """Create a task from configuration with context."""
-        task_config = self.tasks_config[task_name]
-        
-        # Create data context for financial analysis tasks
-        data_context = ""
-        if 'financial_data' in context:
-            financial_data = context['financial_data']
-            data_context = f"""
+    def _build_data_context(self, financial_data: FinancialBundle, data_files: Dict[str, Optional[str]]) -> str:
+        """Build the data context for a stock from the paths and columns of its saved DataFrames."""
+        # Write the header and one manifest per frame into a single buffer
+        buffer = io.StringIO()
+        buffer.write(f"""
         FETCHED DATA FOR PANDAS OPERATIONS:
-        
-        # Income Statement DataFrame (use this exact data):
-        income_statement_data = {financial_data['income_statement'].to_dict('records') if not financial_data['income_statement'].empty else []}
-        income_statement_columns = {list(financial_data['income_statement'].columns) if not financial_data['income_statement'].empty else []}
-        
-        # Balance Sheet DataFrame (use this to query key financial metrics):
-        balance_sheet_data = {financial_data['balance_sheet'].to_dict('records') if not financial_data['balance_sheet'].empty else []}
-        balance_sheet_columns = {list(financial_data['balance_sheet'].columns) if not financial_data['balance_sheet'].empty else []}
-        
-        # Financial Ratios DataFrame (use this exact data):
-        financial_ratios_data = {financial_data['financial_ratios'].to_dict('records') if not financial_data['financial_ratios'].empty else []}
-        financial_ratios_columns = {list(financial_data['financial_ratios'].columns) if not financial_data['financial_ratios'].empty else []}
-        
-        # Cash Flow DataFrame (use this exact data):
-        cash_flow_data = {financial_data['cash_flow'].to_dict('records') if not financial_data['cash_flow'].empty else []}
-        cash_flow_columns = {list(financial_data['cash_flow'].columns) if not financial_data['cash_flow'].empty else []}
-        
-        # Dividend Schedule DataFrame (use this exact data):
-        dividend_data = {financial_data['dividend_schedule'].to_dict('records') if not financial_data['dividend_schedule'].empty else []}
-        dividend_columns = {list(financial_data['dividend_schedule'].columns) if not financial_data['dividend_schedule'].empty else []}
-        """
-            context['data_context'] = data_context
+        The real data is saved as JSON files in pandas 'split' orientation (columns, index, data).
+        Load each file with pd.read_json(path, orient='split') using the code interpreter.
+        Each entry is a JSON object with the file "path" (null when no data was available) and its "columns".
+        Statements are limited to their key line items and the last {MAX_YEARS} fiscal years.
+""")
+        for name, comment, variable in DATA_CONTEXT_FRAMES:
+            manifest = _frame_manifest(data_files[name], getattr(financial_data, name))
+            buffer.write(f"        \n        # {comment}:\n        {variable} = {manifest}\n")
+        buffer.write("        ")
+        return buffer.getvalue()
+    
+    def _create_task(self, task_name: str, agent_name: str, agents: Optional[Dict[str, Agent]] = None, **context) -> Task:
+        """Create a task from configuration with context, assigned to an agent from `agents` (default: self.agents)."""
+        task_config = self.tasks_config[task_name]
+        agents = agents or self.agents
         
         # Format description with context
-        description = task_config['description'].format(**context)
+        description = self._task_templates[task_name].substitute(context)
         
         return Task(
             description=description,
             expected_output=task_config['expected_output'],
-            agent=self.agents[task_config['agent']]
+            agent=agents[task_config['agent']]
         )
     
-    def fetch_financial_data(self, stock_symbol: str) -> Dict[str, pd.DataFrame]:
+    def fetch_financial_data(self, stock_symbol: str) -> Optional[FinancialBundle]:
         """
         Fetch comprehensive financial data for a given stock symbol.
         
@@ -141,10 +281,40 @@ class FinancialAnalysisCrew:
             stock_symbol: Vietnamese stock symbol (e.g., 'VIC', 'REE', 'VHM')
             
         Returns:
-            Dict containing various financial dataframes
+            FinancialBundle with the financial dataframes, or None if fetching failed
         """
         return self.financial_tool.fetch_financial_data(stock_symbol)
     
+    def select_prompt_slice(self, name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the part of a fetched DataFrame that is handed to the analyst agent.
+        
+        Keeps the identifier columns plus the KEEP_COLS line items for the frame (all columns when
+        the frame has no whitelist or none of it matches), and the last MAX_YEARS fiscal years.
+        Override to change what the agent sees.
+        
+        Args:
+            name: FinancialBundle field name of the DataFrame
+            df: DataFrame to slice
+            
+        Returns:
+            pd.DataFrame: The selected columns and rows
+        """
+        keywords = KEEP_COLS.get(name)
+        if keywords:
+            line_items = [col for col in df.columns if any(keyword in str(col).lower() for keyword in keywords)]
+            if line_items:
+                # A boolean mask keeps repeated column labels once instead of selecting each copy twice
+                df = df.loc[:, [col in META_COLS or col in line_items for col in df.columns]]
+        
+        year_col = next((col for col in YEAR_COLS if col in df.columns), None)
+        if year_col is not None:
+            years = pd.to_numeric(df[year_col], errors='coerce')
+            if years.notna().any():
+                df = df[years > years.max() - MAX_YEARS]
+        
+        return df
+    
     def get_company_info(self, stock_symbol: str) -> tuple[str, str]:
         """
         Fetch company information from vnstock API.
@@ -156,52 +326,81 @@ class FinancialAnalysisCrew:
             tuple: (company_name, industry)
         """
         try:
-            listing = Listing()
-            stock_list = listing.symbols_by_industries()
+            # The listing covers every symbol, so it is downloaded at most once a day
+            stock_list = _get_listing_df(datetime.date.today().isoformat())
             
-            # Find the specific stock information
-            stock_info = stock_list[stock_list['symbol'] == stock_symbol.upper()]
+            # Find the specific stock information with a hashed index lookup
+            try:
+                stock_info = stock_list.loc[stock_symbol.upper()]
+            except KeyError:
+                return stock_symbol, ""
             
-            if not stock_info.empty:
-                company_name = str(stock_info.iloc[0]['organ_name'])
-                industry = str(stock_info.iloc[0]['icb_name3'])
-            else:
-                company_name = stock_symbol
-                industry = ""
-                
-            return company_name, industry
+            return str(stock_info['organ_name']), str(stock_info['icb_name3'])
             
         except Exception as e:
             print(f"⚠️ Warning: Could not fetch company info for {stock_symbol}: {str(e)}")
             return stock_symbol, ""
     
-    def run_analysis(self, stock_symbol: str, analysis_type: str = "comprehensive") -> str:
+    def run_analysis(self, stock_symbol: str, analysis_type: str = "comprehensive", per_symbol_output: bool = False) -> str:
         """
         Run the financial analysis and news research for a given stock.
         
         Args:
             stock_symbol: Stock symbol to analyze
             analysis_type: Type of analysis ('comprehensive', 'profitability', 'liquidity')
+            per_symbol_output: Write report_<symbol>.md / news_<symbol>.md using dedicated agents,
+                so that concurrent runs for different symbols do not collide
             
         Returns:
             str: Analysis results
         """
+        return _run_sync(lambda: self.run_analysis_async(stock_symbol, analysis_type, per_symbol_output))
+    
+    async def run_analysis_async(self, stock_symbol: str, analysis_type: str = "comprehensive", per_symbol_output: bool = False) -> str:
+        """
+        Async version of run_analysis; blocking vnstock and file I/O runs in worker threads.
+        
+        Args:
+            stock_symbol: Stock symbol to analyze
+            analysis_type: Type of analysis ('comprehensive', 'profitability', 'liquidity')
+            per_symbol_output: Write report_<symbol>.md / news_<symbol>.md using dedicated agents,
+                so that concurrent runs for different symbols do not collide
+            
+        Returns:
+            str: Analysis results
+        """
+        stock_symbol = stock_symbol.upper()
         try:
-            # Fetch company information and financial data
-            company_name, industry = self.get_company_info(stock_symbol)
-            financial_data = self.fetch_financial_data(stock_symbol)
+            # Fetch company information and financial data concurrently
+            (company_name, industry), financial_data = await asyncio.gather(
+                asyncio.to_thread(self.get_company_info, stock_symbol),
+                asyncio.to_thread(self.fetch_financial_data, stock_symbol)
+            )
             
             if not financial_data:
                 raise ValueError(f"Could not fetch financial data for {stock_symbol}")
             
             print(f"📊 Company Info: {company_name} ({stock_symbol}) - Industry: {industry or 'N/A'}")
             
-            # Create context for tasks
+            # Hand the analyst only the slice of each frame it needs
+            financial_data = FinancialBundle(
+                stock_symbol=stock_symbol,
+                **{name: self.select_prompt_slice(name, df) for name, df in financial_data.frames().items()}
+            )
+            
+            # Save the DataFrames for the analyst to load instead of inlining them in the prompt
+            data_files = await asyncio.to_thread(self.financial_tool.save_financial_data, financial_data)
+            
+            # Create context for tasks. The DataFrames themselves are saved to files, so the
+            # data context only carries their paths and columns; it is built once per run.
             context = {
+                'agents': self._create_agents() if per_symbol_output else self.agents,
                 'stock_symbol': stock_symbol,
                 'company_name': company_name,
                 'industry': industry,
-                'financial_data': financial_data
+                'financial_data': financial_data,
+                'data_files': data_files,
+                'data_context': self._build_data_context(financial_data, data_files)
             }
             
             # Create tasks based on analysis type
@@ -214,24 +413,38 @@ class FinancialAnalysisCrew:
             else:
                 raise ValueError(f"Unknown analysis type: {analysis_type}")
             
-            news_task = self._create_task('news_research', 'news_research_analyst', **context)
-            
-            # Create and run the crew
-            crew = Crew(
-                agents=list(self.agents.values()),
-                tasks=[analysis_task, news_task],
-                process=Process.sequential,
-                verbose=True,
-                memory=True
-            )
+            # Batch requests cannot search the web, so they get the knowledge-only news prompt
+            news_task_name = 'news_background' if self.use_batch_api else 'news_research'
+            news_task = self._create_task(news_task_name, 'news_research_analyst', **context)
             
             print(f"🚀 Starting financial analysis and news research for {stock_symbol}...")
-            result = crew.kickoff()
+            if self.use_batch_api:
+                result = AnalysisResult(
+                    tasks_output=await asyncio.to_thread(self._run_tasks_with_batch_api, analysis_task, news_task, data_files)
+                )
+            else:
+                # The analysis and news tasks are independent, so run each in its own crew concurrently
+                memory_settings = self._memory_settings()
+                analysis_crew, news_crew = (
+                    Crew(
+                        agents=[task.agent],
+                        tasks=[task],
+                        process=Process.sequential,
+                        verbose=True,
+                        **memory_settings
+                    )
+                    for task in (analysis_task, news_task)
+                )
+                crew_outputs = await self._kickoff_crews(analysis_crew, news_crew)
+                
+                result = AnalysisResult(
+                    tasks_output=[output for crew_output in crew_outputs for output in crew_output.tasks_output]
+                )
             
             print(f"✅ Analysis and news research completed for {stock_symbol}")
             
             # Export findings to files
-            self._export_reports(stock_symbol, analysis_type, result)
+            await asyncio.to_thread(self._export_reports, stock_symbol, analysis_type, result, per_symbol_output)
             
             return result
             
@@ -240,15 +453,136 @@ class FinancialAnalysisCrew:
             print(error_msg)
             return error_msg
     
-    def _export_reports(self, stock_symbol: str, analysis_type: str, result) -> None:
+    def _run_tasks_with_batch_api(self, analysis_task: Task, news_task: Task, data_files: Dict[str, Optional[str]]) -> List[str]:
+        """
+        Run the analysis and news tasks as plain chat completions in one OpenAI batch.
+        
+        Tools are unavailable inside a batch, so the saved data files are inlined into the analysis prompt
+        and the news task is expected to be the knowledge-only 'news_background' task.
+        
+        Returns:
+            list: Output text of the analysis and news tasks, in that order
+        """
+        data_sections = [
+            f"\n# {name} ({path}):\n{Path(path).read_text(encoding='utf-8')}"
+            for name, path in data_files.items()
+            if path
+        ]
+        data_appendix = (
+            "\n\nThe code interpreter is not available. The contents of the data files are included below:\n"
+            + "\n".join(data_sections)
+        )
+        
+        requests = []
+        for task, appendix in ((analysis_task, data_appendix), (news_task, "")):
+            agent = task.agent
+            requests.append({
+                "model": self.llm.model,
+                "messages": [
+                    {"role": "system", "content": f"You are a {agent.role}. {agent.backstory}\nYour goal: {agent.goal}"},
+                    {"role": "user", "content": f"{task.description}{appendix}\n\nExpected output: {task.expected_output}"}
+                ]
+            })
+        
+        return run_chat_batch(OpenAI(api_key=self.openai_api_key), requests)
+    
+    def _memory_settings(self) -> Dict[str, Any]:
+        """Crew keyword arguments for memory: disabled, or backed by the store under MEMORY_STORAGE_DIR."""
+        if not self.use_memory:
+            return {'memory': False}
+        
+        os.makedirs(MEMORY_STORAGE_DIR, exist_ok=True)
+        return {
+            'memory': True,
+            'embedder': self.memory_embedder,
+            'short_term_memory': ShortTermMemory(
+                embedder_config=self.memory_embedder,
+                path=os.path.join(MEMORY_STORAGE_DIR, "short_term")
+            ),
+            'entity_memory': EntityMemory(
+                embedder_config=self.memory_embedder,
+                path=os.path.join(MEMORY_STORAGE_DIR, "entities")
+            ),
+            'long_term_memory': LongTermMemory(path=os.path.join(MEMORY_STORAGE_DIR, "long_term_memory.db"))
+        }
+    
+    async def _kickoff_crews(self, analysis_crew: Crew, news_crew: Crew) -> List[Any]:
+        """Kick off the analysis and news crews concurrently and return their outputs in that order."""
+        return await asyncio.gather(
+            asyncio.to_thread(self._kickoff_analysis_crew, analysis_crew),
+            news_crew.kickoff_async()
+        )
+    
+    def _kickoff_analysis_crew(self, crew: Crew) -> Any:
+        """Run an analysis crew, waiting for any other analysis crew in the process to release the code interpreter."""
+        with _CODE_INTERPRETER_LOCK:
+            return crew.kickoff()
+    
+    def run_batch(self, stock_symbols: List[str], analysis_type: str = "comprehensive", max_concurrency: int = 4) -> List[Any]:
+        """
+        Run the financial analysis and news research for several stocks concurrently.
+        
+        Analysis crews are serialized by a process-wide lock around the code interpreter,
+        so concurrency speeds up data fetching and news research only.
+        
+        Args:
+            stock_symbols: Stock symbols to analyze
+            analysis_type: Type of analysis ('comprehensive', 'profitability', 'liquidity')
+            max_concurrency: Maximum number of stocks in flight at the same time. Fetches and news
+                research overlap up to this limit; analysis crews share the code interpreter and
+                always run one at a time
+            
+        Returns:
+            list: Analysis results in the same order as stock_symbols
+        """
+        return _run_sync(lambda: self.run_batch_async(stock_symbols, analysis_type, max_concurrency))
+    
+    async def run_batch_async(self, stock_symbols: List[str], analysis_type: str = "comprehensive", max_concurrency: int = 4) -> List[Any]:
+        """
+        Async version of run_batch, bounding the number of concurrent analyses with a semaphore.
+        
+        Args:
+            stock_symbols: Stock symbols to analyze
+            analysis_type: Type of analysis ('comprehensive', 'profitability', 'liquidity')
+            max_concurrency: Maximum number of stocks in flight at the same time. Fetches and news
+                research overlap up to this limit; analysis crews share the code interpreter and
+                always run one at a time
+            
+        Returns:
+            list: Analysis results in the same order as stock_symbols
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze(symbol: str) -> Any:
+            async with semaphore:
+                return await self.run_analysis_async(symbol, analysis_type, per_symbol_output=True)
+        
+        return await asyncio.gather(*(analyze(symbol) for symbol in stock_symbols))
+    
+    def _export_reports(self, stock_symbol: str, analysis_type: str, result, per_symbol_output: bool = False) -> None:
         """Export analysis results to report files."""
         try:
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            tasks_output = getattr(result, 'tasks_output', [])
+            suffix = f"_{stock_symbol}" if per_symbol_output else ""
             
-            # Export financial analysis report
-            if hasattr(result, 'tasks_output') and len(result.tasks_output) > 0:
-                report_content = f"""# Financial Analysis Report
+            # Both reports are independent files, so write them concurrently
+            exports = []
+            if len(tasks_output) > 0:
+                exports.append(lambda: self._export_analysis_report(f"report{suffix}.md", stock_symbol, analysis_type, timestamp, tasks_output[0]))
+            if len(tasks_output) > 1:
+                exports.append(lambda: self._export_news_report(f"news{suffix}.md", stock_symbol, timestamp, tasks_output[1]))
+            
+            if exports:
+                with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                    list(executor.map(lambda export: export(), exports))
+                
+        except Exception as e:
+            print(f"⚠️ Warning: Could not export reports: {str(e)}")
+    
+    def _export_analysis_report(self, filename: str, stock_symbol: str, analysis_type: str, timestamp: str, analysis_output) -> None:
+        """Export the financial analysis output to a report file."""
+        header = f"""# Financial Analysis Report
 
 **Stock Symbol:** {stock_symbol}  
 **Analysis Type:** {analysis_type.title()}  
@@ -257,29 +591,32 @@ class FinancialAnalysisCrew:
 
 ---
 
-{result.tasks_output[0]}
+"""
+        footer = """
 
 ---
 
 *This report was automatically generated by the CrewAI Financial Analysis Crew.*
 """
-                with open("report.md", 'w', encoding='utf-8') as f:
-                    f.write(report_content)
-                print("✅ Report exported to report.md")
-            
-            # Export news research report
-            if hasattr(result, 'tasks_output') and len(result.tasks_output) > 1:
-                with open("news.md", "w", encoding="utf-8") as f:
-                    f.write(f"# {stock_symbol} - Recent News & Market Intelligence\n\n")
-                    f.write(f"**Generated on:** {timestamp}\n\n")
-                    f.write("---\n\n")
-                    f.write(str(result.tasks_output[1]))
-                    f.write("\n\n---\n\n")
-                    f.write("*This report was generated using CrewAI with news research capabilities.*\n")
-                print("✅ News report exported to news.md")
-                
-        except Exception as e:
-            print(f"⚠️ Warning: Could not export reports: {str(e)}")
+        self._write_segments(filename, [header, str(analysis_output), footer])
+        print(f"✅ Report exported to {filename}")
+    
+    def _export_news_report(self, filename: str, stock_symbol: str, timestamp: str, news_output) -> None:
+        """Export the news research output to a news report file."""
+        self._write_segments(filename, [
+            f"# {stock_symbol} - Recent News & Market Intelligence\n\n",
+            f"**Generated on:** {timestamp}\n\n",
+            "---\n\n",
+            str(news_output),
+            "\n\n---\n\n",
+            "*This report was generated using CrewAI with news research capabilities.*\n"
+        ])
+        print(f"✅ News report exported to {filename}")
+    
+    def _write_segments(self, filename: str, segments: List[str]) -> None:
+        """Write report segments through one large buffer, without joining them into a single string first."""
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(segments)
 
 
 # Legacy support - maintain the old FinancialDataAnalyst class name for backward compatibility
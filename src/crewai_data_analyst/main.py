@@ -6,8 +6,27 @@ This file provides the standard CrewAI entry points for running the crew.
 
 import os
 import sys
+from typing import Any, List
 from .crew import FinancialAnalysisCrew
 
+# Crew shared by every run in this process (configs, LLM client, agents and tools are reusable)
+_CREW = None
+
+def _get_crew() -> FinancialAnalysisCrew:
+    """
+    Return the shared FinancialAnalysisCrew, creating it on first use.
+    """
+    global _CREW
+    if _CREW is None:
+        _CREW = FinancialAnalysisCrew()
+    return _CREW
+
+def run_many(stock_symbols: List[str], analysis_type: str = "comprehensive") -> List[Any]:
+    """
+    Analyze several stocks one after another with the shared crew, writing per-symbol reports.
+    """
+    return _get_crew().run_batch(stock_symbols, analysis_type, max_concurrency=1)
+
 def kickoff():
     """
     Main entry point for running the CrewAI Financial Data Analyst.
@@ -24,26 +43,30 @@ def kickoff():
             print("export OPENAI_API_KEY='your-api-key-here'")
             return
         
-        # Initialize the crew
-        crew = FinancialAnalysisCrew()
+        # Get the shared crew
+        crew = _get_crew()
         
-        # Default stock to analyze
-        stock_symbol = "REE"
+        # Stocks to analyze: command-line arguments, defaulting to REE
+        stock_symbols = [symbol.upper() for symbol in sys.argv[1:]] or ["REE"]
         
-        print(f"📊 Analyzing {stock_symbol} stock with CrewAI crew...")
+        print(f"📊 Analyzing {', '.join(stock_symbols)} with CrewAI crew...")
         print("=" * 60)
         
-        # Run comprehensive analysis
-        result = crew.run_analysis(
-            stock_symbol=stock_symbol,
-            analysis_type="comprehensive"
-        )
+        # Run comprehensive analysis, fanning out across symbols when there are several
+        if len(stock_symbols) == 1:
+            results = [crew.run_analysis(
+                stock_symbol=stock_symbols[0],
+                analysis_type="comprehensive"
+            )]
+        else:
+            results = crew.run_batch(stock_symbols, analysis_type="comprehensive")
         
-        print("\n" + "=" * 80)
-        print("🎯 FINANCIAL ANALYSIS RESULTS")
-        print("=" * 80)
-        print(result)
-        print("=" * 80)
+        for stock_symbol, result in zip(stock_symbols, results):
+            print("\n" + "=" * 80)
+            print(f"🎯 FINANCIAL ANALYSIS RESULTS - {stock_symbol}")
+            print("=" * 80)
+            print(result)
+            print("=" * 80)
         print("✅ Analysis completed successfully!")
         
     except Exception as e:
@@ -2,6 +2,6 @@
 Financial analysis tools for CrewAI
 """
 
-from .financial_data_tools import FinancialDataTool, NewsSearchTool
+from .financial_data_tools import FinancialBundle, FinancialDataTool, NewsSearchTool
 
-__all__ = ['FinancialDataTool', 'NewsSearchTool']
\ No newline at end of file
+__all__ = ['FinancialBundle', 'FinancialDataTool', 'NewsSearchTool']
\ No newline at end of file
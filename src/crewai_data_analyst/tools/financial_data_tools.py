@@ -2,9 +2,16 @@
 Custom tools for Vietnamese stock market analysis
 """
 
+import functools
 import os
+import re
 import warnings
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from vnstock import Vnstock
 
@@ -13,6 +20,55 @@ from crewai_tools import CodeInterpreterTool, BraveSearchTool
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
+# Directory (relative to the working directory, which the code interpreter mounts)
+# where fetched DataFrames are saved for the analyst agent to load
+FINANCIAL_DATA_DIR = "analysis_data"
+
+# Directory where raw vnstock DataFrames are cached as Parquet, one file per symbol, frame and day
+FINANCIAL_CACHE_DIR = ".cache"
+
+# Substitutions applied when flattening ratio column names, done in one regex pass per name
+_CLEAN_MAP = {' ': '_', '-': '_', '(': '', ')': '', '.': '', '%': 'Pct', '/': '_to_'}
+_CLEAN_RE = re.compile(r"[ \-().%/]")
+
+
+def _clean_column_name(name: str) -> str:
+    """Normalize a column name into an identifier-friendly form."""
+    return _CLEAN_RE.sub(lambda match: _CLEAN_MAP[match.group(0)], name)
+
+
+@functools.cache
+def _get_code_interpreter() -> CodeInterpreterTool:
+    """Return the shared code interpreter tool, created on first use."""
+    return CodeInterpreterTool()
+
+
+@functools.cache
+def _get_brave_search(n_results: int = 3) -> BraveSearchTool:
+    """Return the shared Brave search tool for a result count, created on first use."""
+    return BraveSearchTool(n_results=n_results)
+
+
+@dataclass(slots=True)
+class FinancialBundle:
+    """
+    Financial statements and ratios fetched for a single stock symbol.
+    """
+    stock_symbol: str
+    cash_flow: pd.DataFrame
+    balance_sheet: pd.DataFrame
+    income_statement: pd.DataFrame
+    financial_ratios: pd.DataFrame
+    dividend_schedule: pd.DataFrame
+    
+    def frames(self) -> Dict[str, pd.DataFrame]:
+        """Return the DataFrame fields keyed by name."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name != 'stock_symbol'
+        }
+
 
 class FinancialDataTool:
     """
@@ -21,7 +77,58 @@ class FinancialDataTool:
     
     def __init__(self):
         """Initialize the financial data tool."""
-        self.code_interpreter = CodeInterpreterTool()
+        self.code_interpreter = _get_code_interpreter()
+        self._vn = Vnstock()
+        self._stock_cache: Dict[Tuple[str, str], Any] = {}
+    
+    def _get_stock(self, stock_symbol: str, source: str) -> Any:
+        """
+        Return the vnstock stock object for a symbol and source, creating it on first use.
+        
+        Args:
+            stock_symbol: Vietnamese stock symbol (e.g., 'VIC', 'REE', 'VHM')
+            source: vnstock data source (e.g., 'VCI', 'TCBS')
+            
+        Returns:
+            The cached vnstock stock object
+        """
+        key = (stock_symbol, source)
+        if key not in self._stock_cache:
+            self._stock_cache[key] = self._vn.stock(symbol=stock_symbol, source=source)
+        return self._stock_cache[key]
+    
+    def _cached_df(self, stock_symbol: str, name: str, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return a DataFrame from today's on-disk cache, fetching and caching it on a miss.
+        
+        Writing today's file removes the files of earlier days for the same symbol and frame.
+        
+        Args:
+            stock_symbol: Vietnamese stock symbol (e.g., 'VIC', 'REE', 'VHM')
+            name: Name of the DataFrame, used in the cache file name
+            fetch: Callable that fetches the DataFrame from vnstock
+            
+        Returns:
+            pd.DataFrame: The cached or freshly fetched DataFrame
+        """
+        path = Path(FINANCIAL_CACHE_DIR) / f"{stock_symbol}_{name}_{date.today().isoformat()}.parquet"
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not read cached {name} for {stock_symbol}: {str(e)}")
+        
+        df = fetch()
+        if not df.empty:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(path)
+                for stale_path in path.parent.glob(f"{stock_symbol}_{name}_*.parquet"):
+                    if stale_path != path:
+                        stale_path.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not cache {name} for {stock_symbol}: {str(e)}")
+        return df
     
     def _process_ratio_dataframe(self, ratios_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -37,31 +144,25 @@ class FinancialDataTool:
             return ratios_df
             
         try:
-            # Create a copy to avoid modifying the original
-            processed_df = ratios_df.copy()
-            
             # Flatten multi-index columns by combining level 0 and level 1
-            if isinstance(processed_df.columns, pd.MultiIndex):
-                # Create new column names by combining the multi-index levels
-                new_columns = []
-                for col in processed_df.columns:
-                    if col[0] == 'Meta':
-                        # Keep meta columns as is
-                        new_columns.append(col[1])
-                    else:
-                        # Use the English category and metric names directly
-                        category = col[0].replace(' ', '_').replace('-', '_')
-                        metric = col[1].replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'Pct').replace('.', '').replace('/', '_to_')
-                        new_columns.append(f"{category}_{metric}")
+            if isinstance(ratios_df.columns, pd.MultiIndex):
+                # Create new column names by combining the English category and metric names,
+                # operating on whole index levels rather than column by column
+                categories = ratios_df.columns.get_level_values(0)
+                metrics = ratios_df.columns.get_level_values(1)
+                combined = categories.map(_clean_column_name) + '_' + metrics.map(_clean_column_name)
                 
-                # Apply new column names
-                processed_df.columns = new_columns
+                # Keep meta columns as is
+                new_columns = np.where(categories == 'Meta', metrics, combined)
                 
                 print(f"✅ Processed financial ratios DataFrame with {len(new_columns)} columns")
             else:
                 # Single-level columns - already in English, just clean them
-                processed_df.columns = [col.replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'Pct').replace('.', '').replace('/', '_to_') for col in processed_df.columns]
-                print(f"✅ Cleaned financial ratios DataFrame with {len(processed_df.columns)} columns")
+                new_columns = ratios_df.columns.map(_clean_column_name)
+                print(f"✅ Cleaned financial ratios DataFrame with {len(new_columns)} columns")
+            
+            # Apply new column names; only the labels change, so the data blocks are shared
+            processed_df = ratios_df.set_axis(new_columns, axis=1, copy=False)
                 
             return processed_df
             
@@ -69,7 +170,7 @@ class FinancialDataTool:
             print(f"⚠️ Warning: Could not process ratios DataFrame: {str(e)}")
             return ratios_df
     
-    def fetch_financial_data(self, stock_symbol: str) -> Dict[str, Any]:
+    def fetch_financial_data(self, stock_symbol: str) -> Optional[FinancialBundle]:
         """
         Fetch comprehensive financial data for a given stock symbol.
         
@@ -77,28 +178,44 @@ class FinancialDataTool:
             stock_symbol: Vietnamese stock symbol (e.g., 'VIC', 'REE', 'VHM')
             
         Returns:
-            Dict containing various financial dataframes
+            FinancialBundle with the financial dataframes, or None if fetching failed
         """
+        # Normalize once so that the vnstock objects, cache files and saved files share one key
+        stock_symbol = stock_symbol.upper()
         try:
-            # Initialize vnstock
-            stock = Vnstock().stock(symbol=stock_symbol, source="VCI")
-            company = Vnstock().stock(symbol=stock_symbol, source="TCBS").company
+            # Get (cached) vnstock objects
+            stock = self._get_stock(stock_symbol, "VCI")
+            company = self._get_stock(stock_symbol, "TCBS").company
             
-            # Fetch raw financial data
-            raw_ratios = stock.finance.ratio(period="year", lang="en", dropna=True)
-            
-            # Process the ratios DataFrame to handle multi-index columns
-            processed_ratios = self._process_ratio_dataframe(raw_ratios)
-            
-            # Fetch other financial data
-            financial_data = {
-                'cash_flow': stock.finance.cash_flow(period="year"),
-                'balance_sheet': stock.finance.balance_sheet(period="year", lang="en", dropna=True),
-                'income_statement': stock.finance.income_statement(period="year", lang="en", dropna=True),
-                'financial_ratios': processed_ratios,
-                'dividend_schedule': company.dividends(),
-                'stock_symbol': stock_symbol
+            # Fetch raw financial data concurrently - each call is an independent network request,
+            # skipped entirely when today's result is already cached on disk
+            fetchers = {
+                'ratio': lambda: stock.finance.ratio(period="year", lang="en", dropna=True),
+                'cash_flow': lambda: stock.finance.cash_flow(period="year"),
+                'balance_sheet': lambda: stock.finance.balance_sheet(period="year", lang="en", dropna=True),
+                'income_statement': lambda: stock.finance.income_statement(period="year", lang="en", dropna=True),
+                'dividends': lambda: company.dividends(),
             }
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {
+                    name: executor.submit(self._cached_df, stock_symbol, name, fetch)
+                    for name, fetch in fetchers.items()
+                }
+                
+                # Process the ratios DataFrame to handle multi-index columns
+                # while the remaining requests are still in flight
+                processed_ratios = self._process_ratio_dataframe(futures['ratio'].result())
+                
+                results = {name: future.result() for name, future in futures.items()}
+            
+            financial_data = FinancialBundle(
+                stock_symbol=stock_symbol,
+                cash_flow=results['cash_flow'],
+                balance_sheet=results['balance_sheet'],
+                income_statement=results['income_statement'],
+                financial_ratios=processed_ratios,
+                dividend_schedule=results['dividends']
+            )
             
             print(f"✅ Successfully fetched financial data for {stock_symbol}")
             print(f"   - Processed ratios columns: {list(processed_ratios.columns) if not processed_ratios.empty else 'Empty'}")
@@ -106,7 +223,34 @@ class FinancialDataTool:
             
         except Exception as e:
             print(f"❌ Error fetching data for {stock_symbol}: {str(e)}")
-            return {}
+            return None
+    
+    def save_financial_data(self, financial_data: FinancialBundle, output_dir: str = FINANCIAL_DATA_DIR) -> Dict[str, Optional[str]]:
+        """
+        Save each fetched DataFrame to a JSON file so it can be loaded by the code interpreter.
+        
+        Files use pandas' 'split' orientation and load with pd.read_json(path, orient='split').
+        
+        Args:
+            financial_data: FinancialBundle returned by fetch_financial_data
+            output_dir: Directory to write the JSON files into
+            
+        Returns:
+            Dict mapping each DataFrame name to its file path (None for empty DataFrames)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        stock_symbol = financial_data.stock_symbol
+        
+        data_files = {}
+        for name, df in financial_data.frames().items():
+            if df.empty:
+                data_files[name] = None
+                continue
+            path = f"{output_dir}/{stock_symbol}_{name}.json"
+            df.to_json(path, orient='split', date_format='iso')
+            data_files[name] = path
+        
+        return data_files
 
 
 class NewsSearchTool:
@@ -116,7 +260,7 @@ class NewsSearchTool:
     
     def __init__(self):
         """Initialize the news search tool."""
-        self.brave_search = BraveSearchTool(n_results=3)
+        self.brave_search = _get_brave_search(n_results=3)
     
     def search_company_news(self, company_name: str, stock_symbol: str, search_type: str = "general") -> str:
         """